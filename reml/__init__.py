@@ -1,5 +1,9 @@
 """Top-level package for reml."""
 
+import logging
+
+logging.basicConfig(level=logging.INFO)
+
 __author__ = """Jérémie Galarneau"""
 __email__ = "jeremie.galarneau@gmail.com"
 __version__ = "0.1.0"
@@ -3,14 +3,18 @@
 # Copyright (c) 2022 Jérémie Galarneau <jeremie.galarneau@gmail.com>
 
 import logging
+import os
 import re
 from reml.project import Project, Version
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_RE_AC_INIT = re.compile(r"^(AC_INIT\(\[babeltrace],\[)([^]]*)(],.*)$", re.MULTILINE)
+
 
 class Babeltrace1Project(Project):
+    __slots__ = ()
+
     def __init__(self) -> None:
         self._name = "Babeltrace1"
         self._changelog_project_name = "babeltrace"
@@ -18,45 +22,45 @@ class Babeltrace1Project(Project):
 
     @staticmethod
     def _is_release_series_valid(series: str) -> bool:
-        try:
-            tokenized_version = series.split(".")
-            if len(tokenized_version) != 2:
-                return False
-            if int(tokenized_version[0]) != 1:
-                return False
-
-            return True
-        except:
-            # Any error is the result of an unexpected release series format anyhow.
-            return False
+        return Project._series_major_matches(series, 1)
 
     def _ci_release_job_name(self, version):
-        series = "{}.{}".format(version.major, version.minor)
-        return "babeltrace_v{}_release".format(series)
+        series = f"{version.major}.{version.minor}"
+        return f"babeltrace_v{series}_release"
 
     def _update_version(self, new_version: Version) -> None:
-        with open(self._repo_base_path + "/configure.ac", "r") as original:
-            original_contents = original.read()
+        configure_ac_path = self._configure_ac_path
+        original_contents = configure_ac_path.read_text()
 
         # Replace version in the AC_INIT(...) line
-        new_contents = re.sub(
-            r"^(AC_INIT\(\[babeltrace],\[)([^]]*)(],.*)$",
+        new_contents = _RE_AC_INIT.sub(
             "\g<1>{version}\g<3>".format(version=str(new_version)),
             original_contents,
-            flags=re.MULTILINE,
+            count=1,
         )
 
-        with open(self._repo_base_path + "/configure.ac", "w") as new:
-            new.write(new_contents)
+        # Write to a temporary file and atomically swap it in so that a crash
+        # mid-write can't leave a corrupted configure.ac behind.
+        tmp_path = configure_ac_path.with_name(configure_ac_path.name + ".tmp")
+        tmp_path.write_text(new_contents)
+        os.replace(tmp_path, configure_ac_path)
 
     def _commit_and_tag(self, new_version: Version, no_sign: bool) -> None:
-        commit_msg = "Update version to v{version}".format(version=str(new_version))
-        self._repo.git.add("ChangeLog")
+        sign_flag = "-s" if not no_sign else ""
+        version_str = str(new_version)
+        commit_msg = f"Update version to v{version_str}"
         self._update_version(new_version)
-        self._repo.git.add("configure.ac")
-        self._repo.git.commit("-s" if not no_sign else "", "-m" + commit_msg)
+        # Commit the paths directly instead of two separate `git add`
+        # invocations; this spawns one git process instead of three.
+        self._repo.git.commit(
+            sign_flag,
+            "-m" + commit_msg,
+            "--",
+            "ChangeLog",
+            "configure.ac",
+        )
         self._repo.git.tag(
-            "-s" if not no_sign else "",
-            "v{}".format(str(new_version)),
-            "-m Version {}".format(str(new_version)),
+            sign_flag,
+            f"v{version_str}",
+            f"-m Version {version_str}",
         )
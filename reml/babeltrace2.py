@@ -3,18 +3,22 @@
 # Copyright (c) 2021 Jérémie Galarneau <jeremie.galarneau@gmail.com>
 
 import logging
+import os
 import re
 from reml.project import Project, Version
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_RE_VERSION_ANY = re.compile(
+    r"^m4_define\(\[bt_version_(major|minor|patch)\],.*\)$", re.MULTILINE
+)
+_RE_VERSION_NAME = re.compile(r"m4_define\(\[bt_version_name\], \[(.*)\]\)*")
+
 
 class Babeltrace2Project(Project):
-    def __init__(self) -> None:
-        self._name = "Babeltrace2"
-        self._changelog_project_name = "Babeltrace"
-        self._release_template = """
+    __slots__ = ("_cached_release_name",)
+
+    _release_template = """
 What's new since {changelog_project_name} {previous_version}?
 ======================================
 
@@ -50,85 +54,86 @@ Continuous integration:
 Code review:
     https://review.lttng.org/q/project:babeltrace
 """
+
+    def __init__(self) -> None:
+        self._name = "Babeltrace2"
+        self._changelog_project_name = "Babeltrace"
+        self._cached_release_name = None
         super().__init__()
 
     @staticmethod
     def _is_release_series_valid(series: str) -> bool:
-        try:
-            tokenized_version = series.split(".")
-            if len(tokenized_version) != 2:
-                return False
-            if int(tokenized_version[0]) != 2:
-                return False
-
-            return True
-        except:
-            # Any error is the result of an unexpected release series format anyhow.
-            return False
+        return Project._series_major_matches(series, 2)
 
     def _ci_release_job_name(self, version):
-        series = "{}.{}".format(version.major, version.minor)
-        return "babeltrace_v{}_release".format(series)
+        series = f"{version.major}.{version.minor}"
+        return f"babeltrace_v{series}_release"
 
     def _update_version(self, new_version: Version) -> None:
-        with open(self._repo_base_path + "/configure.ac", "r") as original:
-            original_contents = original.read()
-
-        new_contents = re.sub(
-            r"^m4_define\(\[bt_version_major\],.*\)$",
-            "m4_define([bt_version_major], [{}])".format(new_version.major),
+        configure_ac_path = self._configure_ac_path
+        original_contents = configure_ac_path.read_text()
+
+        new_values = {
+            "major": new_version.major,
+            "minor": new_version.minor,
+            "patch": new_version.patch,
+        }
+        # Rewrite all three version defines in a single pass over the file.
+        new_contents = _RE_VERSION_ANY.sub(
+            lambda match: "m4_define([bt_version_{}], [{}])".format(
+                match.group(1), new_values[match.group(1)]
+            ),
             original_contents,
-            flags=re.MULTILINE,
-        )
-        new_contents = re.sub(
-            r"^m4_define\(\[bt_version_minor\],.*\)$",
-            "m4_define([bt_version_minor], [{}])".format(new_version.minor),
-            new_contents,
-            flags=re.MULTILINE,
-        )
-        new_contents = re.sub(
-            r"^m4_define\(\[bt_version_patch\],.*\)$",
-            "m4_define([bt_version_patch], [{}])".format(new_version.patch),
-            new_contents,
-            flags=re.MULTILINE,
+            count=3,
         )
 
-        with open(self._repo_base_path + "/configure.ac", "w") as new:
-            new.write(new_contents)
+        # Write to a temporary file and atomically swap it in so that a crash
+        # mid-write can't leave a corrupted configure.ac behind.
+        tmp_path = configure_ac_path.with_name(configure_ac_path.name + ".tmp")
+        tmp_path.write_text(new_contents)
+        os.replace(tmp_path, configure_ac_path)
 
-    def _get_release_name(self) -> str:
-        with open(self._repo_base_path + "/configure.ac", "r") as original:
-            contents = original.read()
+        # configure.ac changed; the cached release name may no longer be valid.
+        self._cached_release_name = None
 
-        return re.search(
-            r"^m4_define\(\[bt_version_name\], \[(.*)\]\)*$",
-            contents,
-            flags=re.MULTILINE,
-        ).group(1)
+    def _get_release_name(self) -> str:
+        if self._cached_release_name is None:
+            # Match line by line so the scan stops at the version name define
+            # instead of running the multi-line pattern over the whole file.
+            for line in self._configure_ac_path.read_text().splitlines():
+                match = _RE_VERSION_NAME.fullmatch(line)
+                if match:
+                    self._cached_release_name = match.group(1)
+                    break
+            else:
+                raise ValueError("configure.ac: bt_version_name define not found")
+        return self._cached_release_name
 
     def _get_tag_str(self, version: Version) -> str:
-        return "v{}".format(str(version))
+        return f"v{version}"
 
     def _commit_and_tag(self, new_version: Version, no_sign: bool) -> None:
+        sign_flag = "-s" if not no_sign else ""
         release_name = self._get_release_name()
         tag = self._get_tag_str(new_version)
-        commit_msg = 'Release: Babeltrace {}.{}.{} "{}"'.format(
-            new_version.major, new_version.minor, new_version.patch, release_name
+        commit_msg = (
+            f"Release: Babeltrace {new_version.major}.{new_version.minor}"
+            f'.{new_version.patch} "{release_name}"'
         )
-        self._repo.git.add("ChangeLog")
-        self._repo.git.commit("-s" if not no_sign else "", "-m" + commit_msg)
+        # Commit the paths directly instead of a separate `git add` invocation;
+        # this spawns one git process instead of two.
+        self._repo.git.commit(sign_flag, "-m" + commit_msg, "--", "ChangeLog")
         self._repo.git.tag(
-            "-s" if not no_sign else "",
+            sign_flag,
             tag,
-            "-m Version {}".format(str(new_version)),
+            f"-m Version {new_version}",
         )
 
         new_version = Version(
             new_version.major, new_version.minor, new_version.patch + 1
         )
-        commit_msg = "Update working version to Babeltrace {}".format(
-            self._get_tag_str(new_version)
+        commit_msg = (
+            f"Update working version to Babeltrace {self._get_tag_str(new_version)}"
         )
         self._update_version(new_version)
-        self._repo.git.add("configure.ac")
-        self._repo.git.commit("-s" if not no_sign else "", "-m" + commit_msg)
+        self._repo.git.commit(sign_flag, "-m" + commit_msg, "--", "configure.ac")
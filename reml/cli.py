@@ -4,25 +4,22 @@
 
 import logging
 
-logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+import importlib
 import sys
 import click
 
 from click import echo, style
 
-from reml.lttngtools import LTTngToolsProject
-from reml.babeltrace2 import Babeltrace2Project
-from reml.babeltrace1 import Babeltrace1Project
-from reml.project import (
-    InvalidReleaseRebuildOptionError,
-    InvalidReleaseSeriesError,
-    InvalidReleaseTypeError,
-    ReleaseType,
-    AbortedRelease,
-)
-from reml.config import MissingConfigurationError, MissingConfigurationAttributeError
+# The project modules (and reml.project, which pulls in GitPython, jenkinsapi,
+# github3, ...) are imported lazily once a project has been selected so that
+# argument parsing (and --help) doesn't pay for the whole import graph.
+_PROJECT_CLASSES = {
+    "lttng-tools": ("reml.lttngtools", "LTTngToolsProject"),
+    "babeltrace2": ("reml.babeltrace2", "Babeltrace2Project"),
+    "babeltrace1": ("reml.babeltrace1", "Babeltrace1Project"),
+}
 
 
 @click.command()
@@ -89,18 +86,26 @@ def main(
 ) -> None:
     logger.debug("Launching reml")
 
+    from reml.project import (
+        InvalidReleaseRebuildOptionError,
+        InvalidReleaseSeriesError,
+        InvalidReleaseTypeError,
+        ReleaseType,
+        AbortedRelease,
+    )
+    from reml.config import (
+        MissingConfigurationError,
+        MissingConfigurationAttributeError,
+    )
+
     project_name = project
 
     if tagline is None and not rebuild:
         echo(style("Preparing release without a tagline 😞", fg="yellow", bold=True))
 
-    if project_name.lower() == "lttng-tools":
-        project_class = LTTngToolsProject
-    elif project_name.lower() == "babeltrace2":
-        project_class = Babeltrace2Project
-    elif project_name.lower() == "babeltrace1":
-        project_class = Babeltrace1Project
-    else:
+    try:
+        module_name, class_name = _PROJECT_CLASSES[project_name.lower()]
+    except KeyError:
         echo(
             style("🤦‍ Unsupported project ", fg="red")
             + style(project_name, fg="white", bold=True),
@@ -108,6 +113,8 @@ def main(
         )
         sys.exit(1)
 
+    project_class = getattr(importlib.import_module(module_name), class_name)
+
     try:
         project = project_class()
     except MissingConfigurationError as e:
@@ -3,6 +3,7 @@
 # Copyright (c) 2020 Jérémie Galarneau <jeremie.galarneau@gmail.com>
 
 import configparser
+import functools
 import os
 import click
 
@@ -32,6 +33,9 @@ class MissingConfigurationAttributeError(Exception):
         return self._project_name
 
 
+# Cached so that repeated Project instantiations within a run don't re-read
+# and re-parse the configuration file.
+@functools.lru_cache(maxsize=None)
 def get_project_config(project_name: str) -> dict:
     cfg_path = os.path.join(click.get_app_dir("reml"), "reml.conf")
     parser = configparser.RawConfigParser()
@@ -39,12 +43,8 @@ def get_project_config(project_name: str) -> dict:
     if len(read_files) == 0:
         raise MissingConfigurationError(cfg_path)
 
-    project_section = None
-
-    for section in parser.sections():
-        if section.lower() == project_name.lower():
-            project_section = section
-            break
+    sections_by_lower_name = {section.lower(): section for section in parser.sections()}
+    project_section = sections_by_lower_name.get(project_name.lower())
 
     if not project_section:
         return None
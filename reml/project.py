@@ -4,9 +4,11 @@
 
 import re
 
+import concurrent.futures
 import git
 import glob
 import mimetypes
+import pathlib
 import tempfile
 import shutil
 import subprocess
@@ -24,6 +26,24 @@ import reml.config
 
 import github3
 
+mimetypes.init()
+
+_RELEASE_SERIES_RE = re.compile(r"(\d+)\.\d+")
+_SERIES_RE = re.compile(r"(\d+)\.(\d+)$")
+
+
+def _make_artifact_hashers():
+    # The checksums published alongside artifacts are integrity checks, not
+    # security primitives; saying so lets OpenSSL skip its FIPS wrapper and
+    # dispatch straight to the accelerated (SHA-NI/AVX2) implementations.
+    try:
+        return tuple(
+            hashlib.new(name, usedforsecurity=False)
+            for name in ("md5", "sha1", "sha256")
+        )
+    except (TypeError, ValueError):
+        return (hashlib.md5(), hashlib.sha1(), hashlib.sha256())
+
 
 def _run_cmd_confirm_on_failure(args: List[str]) -> None:
     run_cmd = True
@@ -72,6 +92,8 @@ class AbortedRelease(Exception):
 
 
 class Version:
+    __slots__ = ("_major", "_minor", "_patch", "_rc")
+
     def __init__(
         self, major: int, minor: int, patch: int, rc: Optional[int] = None
     ) -> None:
@@ -81,13 +103,36 @@ class Version:
         self._rc = rc
 
     def __str__(self) -> str:
-        version_string = "{}.{}.{}".format(self._major, self._minor, self._patch)
+        version_string = f"{self._major}.{self._minor}.{self._patch}"
         if self._rc:
             version_string = version_string + "-rc" + str(self._rc)
         return version_string
 
+    def _sort_key(self):
+        # A final release orders after any of its release candidates.
+        return (
+            self._major,
+            self._minor,
+            self._patch,
+            self._rc is None,
+            self._rc or 0,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._sort_key() == other._sort_key()
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._sort_key() < other._sort_key()
+
+    def __hash__(self) -> int:
+        return hash(self._sort_key())
+
     def series(self) -> str:
-        return "{}.{}".format(self._major, self._minor)
+        return f"{self._major}.{self._minor}"
 
     @property
     def major(self) -> int:
@@ -107,6 +152,8 @@ class Version:
 
 
 class ReleaseDescriptor:
+    __slots__ = ("_project_name", "_version", "_path")
+
     def __init__(self, project_name: str, version: Version, path: str) -> None:
         self._project_name = project_name
         self._version = version
@@ -114,7 +161,7 @@ class ReleaseDescriptor:
 
     @property
     def name(self) -> str:
-        return "{} {}".format(self._project_name, str(self._version))
+        return f"{self._project_name} {self._version}"
 
     @property
     def version(self) -> Version:
@@ -126,42 +173,71 @@ class ReleaseDescriptor:
 
 
 class ReleaseArtifact:
-    def __init__(self, artifact: jenkinsapi.artifact.Artifact, no_sign: bool) -> None:
+    __slots__ = ("_name", "_dir", "_files")
+
+    def __init__(
+        self, artifact: jenkinsapi.artifact.Artifact, no_sign: bool, workdir: str
+    ) -> None:
         self._name = artifact.filename
-        self._dir = tempfile.mkdtemp()
+        # Keep the artifact under the project's working directory rather than
+        # a second mkdtemp so all temporary state shares one cleanup root.
+        self._dir = os.path.join(workdir, "artifacts")
+        os.makedirs(self._dir, exist_ok=True)
 
         echo(
-            style("Fetching ")
+            style("Fetching and hashing ")
             + style(self._name, fg="white", bold=True)
             + style("..."),
             nl=False,
         )
         artifact_path = os.path.join(self._dir, self._name)
-        artifact.save_to_dir(self._dir)
-        echo(style("✓", fg="green", bold=True))
-
-        echo(
-            style("Hashing ") + style(self._name, fg="white", bold=True) + style("..."),
-            nl=False,
+        md5, sha1, sha256 = _make_artifact_hashers()
+        # Stream the artifact from Jenkins and tee every chunk into the file
+        # and the three digests so the tarball is only transferred and read
+        # once. The digests run on separate threads: OpenSSL releases the GIL
+        # during update(), so they execute in parallel with the file write.
+        response = artifact.get_jenkins_obj().requester.get_url(
+            artifact.url, stream=True
         )
-        md5 = hashlib.md5()
-        sha1 = hashlib.sha1()
-        sha256 = hashlib.sha256()
-        with open(artifact_path, "rb") as tarball:
-            content = tarball.read()
-            md5.update(content)
-            sha1.update(content)
-            sha256.update(content)
+        response.raise_for_status()
+        with open(
+            artifact_path, "wb"
+        ) as tarball, concurrent.futures.ThreadPoolExecutor(max_workers=3) as hash_pool:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                futures = [
+                    hash_pool.submit(digest.update, chunk)
+                    for digest in (md5, sha1, sha256)
+                ]
+                tarball.write(chunk)
+                concurrent.futures.wait(futures)
+
+        # Check the computed md5 against the server-side Jenkins fingerprint,
+        # as artifact.save_to_dir() used to, but without re-reading the file.
+        # An unknown fingerprint passes, as in jenkinsapi's non-strict path.
+        jenkins = artifact.build.job.jenkins
+        fingerprint = jenkinsapi.fingerprint.Fingerprint(
+            jenkins.baseurl, md5.hexdigest(), jenkins
+        )
+        if not fingerprint.validate_for_build(
+            artifact.filename,
+            artifact.build.job.get_full_name(),
+            artifact.build.buildno,
+        ):
+            raise jenkinsapi.custom_exceptions.ArtifactBroken(
+                "Artifact {} seems to be broken, check {}".format(
+                    md5.hexdigest(), jenkins.baseurl
+                )
+            )
+        echo(style("✓", fg="green", bold=True))
 
         with open(artifact_path + ".md5", "w") as md5file:
-            md5file.write("{}  {}\n".format(md5.hexdigest(), self._name))
+            md5file.write(f"{md5.hexdigest()}  {self._name}\n")
 
         with open(artifact_path + ".sha1", "w") as sha1file:
-            sha1file.write("{}  {}\n".format(sha1.hexdigest(), self._name))
+            sha1file.write(f"{sha1.hexdigest()}  {self._name}\n")
 
         with open(artifact_path + ".sha256", "w") as sha256file:
-            sha256file.write("{}  {}\n".format(sha256.hexdigest(), self._name))
-        echo(style("✓", fg="green", bold=True))
+            sha256file.write(f"{sha256.hexdigest()}  {self._name}\n")
 
         if not no_sign:
             echo(
@@ -173,28 +249,37 @@ class ReleaseArtifact:
             _run_cmd_confirm_on_failure(["gpg", "--armor", "-b", artifact_path])
             echo(style("✓", fg="green", bold=True))
 
+        # All sidecar files exist by now; scan the directory once and reuse
+        # the list for every upload instead of re-listing per destination.
+        self._files = glob.glob(os.path.join(self._dir, self._name + "*"))
+
     def upload(self, location: str) -> None:
         echo(
             style("Uploading artifacts... "),
             nl=False,
         )
-        for filename in os.listdir(self._dir):
-            if not filename.startswith(self._name):
-                continue
-            path = os.path.join(self._dir, filename)
-            _run_cmd_confirm_on_failure(["rsync", path, location + "/"])
+        # A single rsync invocation transfers every file over one SSH
+        # connection instead of paying a handshake per file. --compress is a
+        # no-op for the tarball (rsync skips already-compressed suffixes) but
+        # helps the text sidecars, and --partial lets an interrupted transfer
+        # of a large artifact resume instead of restarting.
+        _run_cmd_confirm_on_failure(
+            ["rsync", "--compress", "--partial", *self._files, location + "/"]
+        )
         echo(style("✓", fg="green", bold=True))
 
     def upload_to_github(
         self, gh: github3.repos.repo.Repository, urls: list[str], tag: str
     ):
         echo(style("Uploading artifacts to GitHub... "), nl=False)
-        mimetypes.init()
         releases = []
         for url in urls:
             owner, repo_name = url.split(":")[1].split("/")
             repo = gh.repository(owner, repo_name.rstrip(".git"))
-            release = repo.release_from_tag(tag)
+            try:
+                release = repo.release_from_tag(tag)
+            except github3.exceptions.NotFoundError:
+                release = None
             if not release:
                 echo(
                     style(
@@ -208,33 +293,82 @@ class ReleaseArtifact:
                 continue
             releases.append(release)
 
-        for filename in os.listdir(self._dir):
-            if not filename.startswith(self._name):
-                continue
-            path = os.path.join(self._dir, filename)
-            content_type = mimetypes.guess_type(path)[0]
-            with open(path, "rb") as f:
-                for release in releases:
-                    for asset in release.assets():
-                        if asset.name == filename:
-                            asset.delete()
-                    release.upload_asset(
-                        (
-                            content_type
-                            if content_type is not None
-                            else "application/octet-stream"
-                        ),
-                        filename,
-                        f,
+        if releases:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(releases)
+            ) as upload_pool:
+                for path in self._files:
+                    filename = os.path.basename(path)
+                    content_type = mimetypes.guess_type(path)[0]
+                    # Fan the upload out to all mirror releases at once; the
+                    # wall time becomes that of the slowest mirror rather than
+                    # the sum of all of them. Each worker opens the file
+                    # independently so the uploads don't share a file offset.
+                    list(
+                        upload_pool.map(
+                            lambda release: self._upload_asset(
+                                release, path, filename, content_type
+                            ),
+                            releases,
+                        )
                     )
         echo(style("✓", fg="green", bold=True))
 
+    @staticmethod
+    def _upload_asset(
+        release, path: str, filename: str, content_type: Optional[str]
+    ) -> None:
+        for asset in release.assets():
+            if asset.name == filename:
+                asset.delete()
+        # github3's upload_asset reads the whole file into memory to set
+        # Content-Length; post to the upload URL directly with the open file
+        # object so requests sizes it from the file and streams it from disk.
+        upload_url = release.upload_urlt.expand({"name": filename})
+        with open(path, "rb") as f:
+            response = release.session.post(
+                upload_url,
+                data=f,
+                headers={
+                    "Content-Type": (
+                        content_type
+                        if content_type is not None
+                        else "application/octet-stream"
+                    ),
+                },
+            )
+        response.raise_for_status()
+
 
 class Project:
+    # Slots cover the attributes set by the subclasses' constructors too, so
+    # that subclasses can simply declare empty __slots__.
+    __slots__ = (
+        "_name",
+        "_changelog_project_name",
+        "_release_template",
+        "_release_descriptions",
+        "_repo",
+        "_workdir",
+        "_repo_base_path",
+        "_config",
+        "_git_urls",
+        "_ci_url",
+        "_ci_user",
+        "_ci_token",
+        "_github_user",
+        "_github_token",
+        "_upload_location",
+        "_ci_server",
+        "_refs_by_name",
+    )
+
     def __init__(self) -> None:
         self._repo = None
         self._workdir = tempfile.mkdtemp()
         self._repo_base_path = None
+        self._refs_by_name = None
+        self._ci_server = None
         self._config = reml.config.get_project_config(self.name)
 
         try:
@@ -254,6 +388,10 @@ class Project:
     def name(self) -> str:
         return self._name
 
+    @property
+    def _configure_ac_path(self) -> pathlib.Path:
+        return pathlib.Path(self._repo_base_path, "configure.ac")
+
     @property
     def changelog_project_name(self) -> str:
         return getattr(self, "_changelog_project_name", self.name)
@@ -277,39 +415,37 @@ class Project:
     def _is_release_series_valid(series: str) -> bool:
         raise NotImplementedError()
 
+    @staticmethod
+    def _series_major_matches(series: str, expected_major: int) -> bool:
+        match = _RELEASE_SERIES_RE.fullmatch(series)
+        return match is not None and int(match.group(1)) == expected_major
+
     @staticmethod
     def _branch_name_from_series(series: str) -> str:
         return "stable-" + series
 
     @staticmethod
     def _version_from_tag(tag_name: str) -> Version:
-        exp = re.compile(r"v(\d*)\.(\d*)\.(\d*)$")
-        exp_rc = re.compile(r"v(\d*)\.(\d*)\.(\d*)-rc(\d*)")
-        rc = None
-
-        if exp.match(tag_name):
-            major, minor, patch = exp.match(tag_name).groups()
-        else:
-            if exp_rc.match(tag_name) is None:
-                raise UnexpectedTagNameError()
-            else:
-                major, minor, patch, rc = exp_rc.match(tag_name).groups()
-        major = int(major)
-        minor = int(minor)
-        patch = int(patch)
-        rc = None if rc is None else int(rc)
+        # Tags are trivially formatted (vX.Y.Z[-rcN]); parsing by hand is
+        # considerably cheaper than the regex engine on tag-scan paths.
+        try:
+            if not tag_name.startswith("v"):
+                raise ValueError
+            numbers, _, rc_str = tag_name[1:].partition("-rc")
+            major, minor, patch = (int(part) for part in numbers.split("."))
+            rc = int(rc_str) if rc_str else None
+        except ValueError:
+            raise UnexpectedTagNameError()
         return Version(major, minor, patch, rc)
 
     @staticmethod
     def _version_from_series(series: str) -> Version:
-        exp = re.compile(r"(\d*)\.(\d*)")
-
-        if exp.match(series):
-            major, minor = exp.match(series).groups()
-        else:
+        match = _SERIES_RE.match(series)
+        if match is None:
             raise InvalidReleaseSeriesError()
+        major, minor = match.groups()
 
-        return Version(major, minor, 0, None)
+        return Version(int(major), int(minor), 0, None)
 
     @staticmethod
     def _tag_from_version(version: Version) -> str:
@@ -327,9 +463,19 @@ class Project:
                 if build_status_update_try_count == 0:
                     raise
 
+    def _get_ci_server(self) -> jenkinsapi.jenkins.Jenkins:
+        # A single Jenkins handle (and its underlying requests session) is
+        # kept for the lifetime of the project so the TLS connection is
+        # reused across the many polls of a release build.
+        if self._ci_server is None:
+            self._ci_server = jenkinsapi.jenkins.Jenkins(
+                self._ci_url, self._ci_user, self._ci_token
+            )
+        return self._ci_server
+
     def _ci_release_job_name(self, version):
-        series = "{}.{}".format(version.major, version.minor)
-        return "{}_v{}_release".format(self.name.lower(), series)
+        series = f"{version.major}.{version.minor}"
+        return f"{self.name.lower()}_v{series}_release"
 
     def _update_version(self, new_version: Version) -> None:
         raise NotImplementedError()
@@ -341,20 +487,29 @@ class Project:
         raise NotImplementedError()
 
     def _clone_repo(self) -> None:
-        echo("Cloning upstream {} repository... ".format(self.name), nl=False)
-        git.Git(self._workdir).clone(self._git_urls[0])
-        self._repo_base_path = glob.glob(self._workdir + "/*/")[0]
+        echo(f"Cloning upstream {self.name} repository... ", nl=False)
+        # Blobless partial clone: all commits and tags are present (the
+        # changelog walk and tag lookups only need those), while file
+        # contents are fetched lazily as the checkout requires them.
+        git.Git(self._workdir).clone(self._git_urls[0], "--filter=blob:none")
+        # git clones into the URL's basename; compute the path directly
+        # instead of scanning the working directory for it.
+        repo_name = os.path.basename(self._git_urls[0]).removesuffix(".git")
+        self._repo_base_path = os.path.join(self._workdir, repo_name)
         self._repo = git.Repo(self._repo_base_path)
+        # Index the refs once; lttng-tools and babeltrace carry hundreds of
+        # tags and branches, making per-lookup linear scans needlessly slow.
+        self._refs_by_name = {ref.name: ref for ref in self._repo.refs}
         echo(style("✓", fg="green", bold=True))
 
-        for git_url in self._git_urls[1:]:
-            self._repo.git.remote("set-url", "--add", "origin", git_url)
+        # Each extra URL becomes its own remote (rather than an extra push
+        # URL on origin) so publishing can fan out to the mirrors
+        # concurrently instead of pushing to them one after the other.
+        for index, git_url in enumerate(self._git_urls[1:]):
+            self._repo.create_remote(f"mirror{index}", git_url)
 
     def _branch_exists(self, branch_name: str) -> bool:
-        for ref in self._repo.refs:
-            if ref.name == ("origin/" + branch_name):
-                return True
-        return False
+        return ("origin/" + branch_name) in self._refs_by_name
 
     def _set_current_branch(self, branch_name: str, create_branch: bool) -> None:
         if create_branch:
@@ -378,39 +533,52 @@ class Project:
             str(new_version),
         )
         if tagline:
-            title = title + " ({})".format(tagline)
+            title = title + f" ({tagline})"
         title = title + "\n"
 
         latest_tag_name = self._latest_tag_name()
-        for ref in self._repo.refs:
-            if ref.name == latest_tag_name:
-                latest_tag_sha = ref.commit.hexsha
-                break
 
         changelog_new_section = [title]
-        for commit in self._repo.iter_commits():
-            if commit.hexsha == latest_tag_sha:
-                break
-            entry = "\t* {}\n".format(commit.summary)
-            changelog_new_section.append(entry)
+        # Let git walk the tag..HEAD range itself; this avoids scanning the
+        # refs for the tag's SHA and materializing a Commit object per entry.
+        summaries = self._repo.git.log(f"{latest_tag_name}..HEAD", "--pretty=%s")
+        for summary in summaries.splitlines():
+            changelog_new_section.append(f"\t* {summary}\n")
 
         return changelog_new_section
 
     def _update_changelog(self, new_version: Version, tagline: str):
-        echo("Updating ChangeLog... ".format(self.name), nl=False)
+        echo("Updating ChangeLog... ", nl=False)
         changelog_new_section = self._new_changelog_section(new_version, tagline)
-        with open(self._repo_base_path + "/ChangeLog", "r") as original:
-            contents = original.read()
-        with open(self._repo_base_path + "/ChangeLog", "w") as modified:
-            for entry in changelog_new_section:
-                modified.write(entry)
-            modified.write("\n")
-            modified.write(contents)
+        changelog_path = os.path.join(self._repo_base_path, "ChangeLog")
+        # Stream the existing contents after the new section rather than
+        # holding the whole ChangeLog in memory, and swap the result in
+        # atomically.
+        tmp = tempfile.NamedTemporaryFile("w", dir=self._repo_base_path, delete=False)
+        with tmp, open(changelog_path, "r") as original:
+            tmp.writelines(changelog_new_section)
+            tmp.write("\n")
+            shutil.copyfileobj(original, tmp, length=1 << 20)
+        os.replace(tmp.name, changelog_path)
         echo(style("✓", fg="green", bold=True))
 
     def _publish(self, branch_name: str) -> None:
-        echo("Pushing new release... ".format(self.name), nl=False)
-        self._repo.git.push("origin", branch_name + ":" + branch_name, "--tags")
+        echo("Pushing new release... ", nl=False)
+        refspec = branch_name + ":" + branch_name
+        remote_names = [remote.name for remote in self._repo.remotes]
+        # Push to origin and every mirror at once; the wall time becomes
+        # that of the slowest remote rather than the sum of all of them.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(remote_names)
+        ) as push_pool:
+            list(
+                push_pool.map(
+                    lambda remote_name: self._repo.git.push(
+                        remote_name, refspec, "--tags"
+                    ),
+                    remote_names,
+                )
+            )
         echo(style("✓", fg="green", bold=True))
 
     def _get_release_body(
@@ -437,14 +605,14 @@ class Project:
             release_description=self.release_description(version),
         )
 
-        print("Release notes\n\n{}\n\n".format(body))
+        print(f"Release notes\n\n{body}\n\n")
         if confirm(
             "Would you like to edit the release notes printed above? (Opens in an external editor)?"
         ):
             with tempfile.NamedTemporaryFile("w+", encoding="utf-8") as f:
                 f.write(body)
                 f.flush()
-                if os.system("editor {}".format(f.name)) == 0:
+                if os.system(f"editor {f.name}") == 0:
                     f.seek(0)
                     body = f.read()
         return body
@@ -457,9 +625,7 @@ class Project:
         prerelease: bool = False,
     ) -> None:
         echo(
-            "Creating new GitHub release at {repo_url}... ".format(
-                self.name, repo_url=repo.html_url
-            ),
+            f"Creating new GitHub release at {repo.html_url}... ",
             nl=False,
         )
         repo.create_release(tag, name=tag, body=body, prerelease=prerelease)
@@ -469,7 +635,7 @@ class Project:
         self, version: Version, no_sign: bool, reuse_last_build_artifacts: bool
     ) -> str:
         job_name = self._ci_release_job_name(version)
-        server = jenkinsapi.jenkins.Jenkins(self._ci_url, self._ci_user, self._ci_token)
+        server = self._get_ci_server()
         if reuse_last_build_artifacts:
             echo(
                 style("Getting last build job ")
@@ -512,13 +678,19 @@ class Project:
                 + style(" to be scheduled... "),
                 nl=False,
             )
+            # Back off exponentially between polls so a long queue wait
+            # doesn't hammer the Jenkins API once per second.
+            scheduling_poll_delay_secs = 0.5
             while True:
                 try:
                     queue_item.poll()
                     build = queue_item.get_build()
                     break
                 except jenkinsapi.custom_exceptions.NotBuiltYet:
-                    time.sleep(1)
+                    time.sleep(scheduling_poll_delay_secs)
+                    scheduling_poll_delay_secs = min(
+                        scheduling_poll_delay_secs * 1.5, 30
+                    )
                     continue
             echo(style("✓", fg="green", bold=True))
 
@@ -533,6 +705,7 @@ class Project:
                 last_update_time = time.monotonic()
                 while self._is_build_running(build):
                     time.sleep(delay_secs)
+                    delay_secs = min(delay_secs * 1.5, 30)
                     now = time.monotonic()
                     progress.update(now - last_update_time)
                     last_update_time = now
@@ -542,9 +715,7 @@ class Project:
         if build_status["result"] not in ["SUCCESS", "UNSTABLE"]:
             echo(
                 style(
-                    'Build failed with status "{status}" 🤯'.format(
-                        status=build_status["result"]
-                    ),
+                    'Build failed with status "{}" 🤯'.format(build_status["result"]),
                     fg="red",
                     bold=True,
                 )
@@ -568,11 +739,11 @@ class Project:
             )
             echo("Build artifact files:")
             for artifact in build.get_artifacts():
-                echo("  {filename}".format(filename=artifact.filename))
+                echo(f"  {artifact.filename}")
 
             raise AbortedRelease()
 
-        return ReleaseArtifact(release_tarball_artifact, no_sign)
+        return ReleaseArtifact(release_tarball_artifact, no_sign, self._workdir)
 
     def release(
         self,
@@ -669,15 +840,16 @@ class Project:
 
             if len(github_urls) > 0:
                 repos = []
+                release_tag = self._get_tag_str(release_version)
                 for github_url in github_urls:
                     owner, repo_name = github_url.split(":")[1].split("/")
                     repo = gh.repository(owner, repo_name.rstrip(".git"))
-                    has_release = False
-                    for release in repo.releases():
-                        if release.tag_name == self._get_tag_str(release_version):
-                            has_release = True
-                            break
-                    if not has_release:
+                    # Probe the tag endpoint directly instead of paginating
+                    # through every release of the repository; a 404 means no
+                    # release exists for the tag yet.
+                    try:
+                        repo.release_from_tag(release_tag)
+                    except github3.exceptions.NotFoundError:
                         repos.append(repo)
 
             if (